@@ -1,19 +1,32 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash
+import time
+
+_import_start = time.perf_counter()
+
+from flask import Flask, Blueprint, current_app, render_template, request, jsonify, session, redirect, url_for, flash
 from flask_mail import Mail, Message
 from werkzeug.security import check_password_hash, generate_password_hash
-from functools import wraps
+from functools import wraps, lru_cache
 from database import (
-    init_db, get_all_articles, get_articles_paginated, get_article_by_id,
+    get_all_articles, get_articles_paginated, get_article_by_id, get_related_articles,
+    get_article_changes,
     create_article, update_article, delete_article,
-    create_contact_message
+    create_contact_message, ping_db, DATA_DIR, SUPPORTED_LANGUAGES
 )
+from publish import publish_if_enabled
+from serialization import FastJSONProvider
+from feeds import build_sitemap, build_feed, get_cached
+from content_cache import GenerationCache
 import os
+import shutil
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = Flask(__name__)
-app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+IMPORT_SECONDS = time.perf_counter() - _import_start
+
+bp = Blueprint('site', __name__)
+mail = Mail()
 
 # Custom Jinja2 filter to truncate text to a max number of words
 def truncate_words(text, max_words=50):
@@ -24,71 +37,117 @@ def truncate_words(text, max_words=50):
         return text
     return ' '.join(words[:max_words]) + '...'
 
-app.jinja_env.filters['truncate_words'] = truncate_words
+@lru_cache(maxsize=None)
+def get_admin_password_hash() -> str:
+    """Admin password hash, derived at most once per process.
 
-# Flask-Mail configuration
-app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
-app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
-app.config['MAIL_USE_TLS'] = os.getenv('MAIL_USE_TLS', 'True') == 'True'
-app.config['MAIL_USE_SSL'] = os.getenv('MAIL_USE_SSL', 'False') == 'True'
-app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
-app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
-app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_DEFAULT_SENDER', os.getenv('MAIL_USERNAME'))
-app.config['MAIL_RECIPIENT'] = os.getenv('MAIL_RECIPIENT', 'hernanthiers@gmail.com')
+    Falls back to a hash of the default password only when ADMIN_PASSWORD_HASH
+    is unset; an empty value matches no password, so nobody can log in. The
+    derivation is deliberately slow, so it runs on the first login attempt
+    instead of at import time in every worker.
+    """
+    password_hash = current_app.config['ADMIN_PASSWORD_HASH']
+    if password_hash is None:
+        password_hash = generate_password_hash('changeme')
+    return password_hash
 
-mail = Mail(app)
+def create_app() -> Flask:
+    """Create and configure the Flask application.
 
-# Admin credentials (in production, use environment variables)
-ADMIN_USERNAME = os.getenv('ADMIN_USERNAME', 'admin')
-ADMIN_PASSWORD_HASH = os.getenv('ADMIN_PASSWORD_HASH', generate_password_hash('changeme'))
+    Import and app setup do no hashing and no database I/O; the database
+    is created lazily on first use (see database.ensure_db), or up front
+    in the gunicorn master when the app is preloaded.
+    """
+    start = time.perf_counter()
+
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+
+    app.jinja_env.filters['truncate_words'] = truncate_words
+    # Keep rendered pages and fragments free of blank template lines
+    app.jinja_env.trim_blocks = True
+    app.jinja_env.lstrip_blocks = True
+
+    # Flask-Mail configuration
+    app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
+    app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
+    app.config['MAIL_USE_TLS'] = os.getenv('MAIL_USE_TLS', 'True') == 'True'
+    app.config['MAIL_USE_SSL'] = os.getenv('MAIL_USE_SSL', 'False') == 'True'
+    app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
+    app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
+    app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_DEFAULT_SENDER', os.getenv('MAIL_USERNAME'))
+    app.config['MAIL_RECIPIENT'] = os.getenv('MAIL_RECIPIENT', 'hernanthiers@gmail.com')
+
+    # Public base URL for sitemap/feed links (defaults to the request host)
+    app.config['SITE_URL'] = os.getenv('SITE_URL')
+
+    # Admin credentials (in production, use environment variables)
+    app.config['ADMIN_USERNAME'] = os.getenv('ADMIN_USERNAME', 'admin')
+    app.config['ADMIN_PASSWORD_HASH'] = os.getenv('ADMIN_PASSWORD_HASH')
+
+    mail.init_app(app)
+    app.register_blueprint(bp)
+
+    app.config['STARTUP_TIMINGS'] = {
+        'import_ms': round(IMPORT_SECONDS * 1000, 1),
+        'create_app_ms': round((time.perf_counter() - start) * 1000, 1)
+    }
+    print(f"Startup (pid {os.getpid()}): import {app.config['STARTUP_TIMINGS']['import_ms']}ms, "
+          f"create_app {app.config['STARTUP_TIMINGS']['create_app_ms']}ms")
 
-# Initialize database on first run
-DATA_DIR = os.getenv('DATA_DIR', 'data')
-DB_PATH = os.path.join(DATA_DIR, 'portfolio.db')
-if not os.path.exists(DB_PATH):
-    init_db()
+    return app
 
 # Authentication decorator
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if 'logged_in' not in session:
-            return redirect(url_for('login', next=request.url))
+            return redirect(url_for('site.login', next=request.url))
         return f(*args, **kwargs)
     return decorated_function
 
-@app.route('/')
-def index():
-    """Render the main page with portfolio articles (first 6)."""
+@bp.route('/')
+@bp.route('/en/', defaults={'lang': 'en'})
+def index(lang=None):
+    """Render the main page with portfolio articles (first 6).
+
+    /en/ (or the query parameter `lang`) sets the initial language; the
+    static publisher renders / and /en/ as index.html and en/index.html.
+    """
+    if lang is None:
+        lang = request.args.get('lang', 'es')
+    if lang not in ('es', 'en'):
+        lang = 'es'
     data = get_articles_paginated(limit=6, offset=0)
-    return render_template('index.html', articles=data['articles'], has_more=data['has_more'], total=data['total'])
+    return render_template('index.html', articles=data['articles'], has_more=data['has_more'], total=data['total'], lang=lang)
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     """Admin login page."""
     if request.method == 'POST':
         username = request.form.get('username')
         password = request.form.get('password')
 
-        if username == ADMIN_USERNAME and check_password_hash(ADMIN_PASSWORD_HASH, password):
+        if username == current_app.config['ADMIN_USERNAME'] and check_password_hash(get_admin_password_hash(), password):
             session['logged_in'] = True
             session['username'] = username
             next_page = request.args.get('next')
-            return redirect(next_page or url_for('admin'))
+            return redirect(next_page or url_for('site.admin'))
         else:
             flash('Invalid username or password', 'error')
 
     return render_template('login.html')
 
-@app.route('/logout')
+@bp.route('/logout')
 def logout():
     """Logout the admin user."""
     session.pop('logged_in', None)
     session.pop('username', None)
     flash('You have been logged out successfully', 'success')
-    return redirect(url_for('index'))
+    return redirect(url_for('site.index'))
 
-@app.route('/admin')
+@bp.route('/admin')
 @login_required
 def admin():
     """Admin interface for managing portfolio articles."""
@@ -96,36 +155,110 @@ def admin():
 
 # API Endpoints
 
-@app.route('/api/articles', methods=['GET'])
+@bp.route('/api/articles', methods=['GET'])
 def api_get_articles():
     """Get portfolio articles as JSON with optional pagination.
 
     Query parameters:
     - limit: Number of articles to return (default: all if not specified)
     - offset: Number of articles to skip (default: 0)
+    - lang: Return only this language (default: Spanish plus title_en/description_en)
 
     If limit is specified, returns paginated response with has_more flag.
     If limit is not specified, returns all articles (backward compatible).
     """
     limit = request.args.get('limit', type=int)
     offset = request.args.get('offset', default=0, type=int)
+    lang = request.args.get('lang')
+
+    if lang is not None and lang not in SUPPORTED_LANGUAGES:
+        return jsonify({'error': 'Unsupported language'}), 400
 
     if limit is not None:
-        data = get_articles_paginated(limit=limit, offset=offset)
+        data = get_articles_paginated(limit=limit, offset=offset, lang=lang)
         return jsonify(data)
     else:
-        articles = get_all_articles()
+        articles = get_all_articles(lang=lang)
         return jsonify(articles)
 
-@app.route('/api/articles/<int:article_id>', methods=['GET'])
+# Path-only forms of the read endpoints. The static publisher writes files
+# under these same paths, so a plain file server can answer them.
+
+@bp.route('/api/articles.json', methods=['GET'])
+def api_get_articles_file():
+    """All articles, as GET /api/articles."""
+    return jsonify(get_all_articles())
+
+@bp.route('/api/articles/page/<int:limit>/<int:offset>.json', methods=['GET'])
+def api_get_articles_page(limit, offset):
+    """One page of articles, as GET /api/articles?limit=&offset=."""
+    return jsonify(get_articles_paginated(limit=limit, offset=offset))
+
+@bp.route('/api/articles/<int:article_id>', methods=['GET'])
 def api_get_article(article_id):
-    """Get a single portfolio article by ID."""
+    """Get a single portfolio article by ID (optional `lang` as in api_get_articles)."""
+    lang = request.args.get('lang')
+    if lang is not None and lang not in SUPPORTED_LANGUAGES:
+        return jsonify({'error': 'Unsupported language'}), 400
+
+    article = get_article_by_id(article_id, lang=lang)
+    if article is None:
+        return jsonify({'error': 'Article not found'}), 404
+    return jsonify(article)
+
+@bp.route('/api/articles/<int:article_id>.json', methods=['GET'])
+def api_get_article_file(article_id):
+    """A single article, as GET /api/articles/<id>."""
     article = get_article_by_id(article_id)
     if article is None:
         return jsonify({'error': 'Article not found'}), 404
     return jsonify(article)
 
-@app.route('/api/articles', methods=['POST'])
+@bp.route('/api/articles/changes', methods=['GET'])
+def api_get_article_changes():
+    """Get articles created, updated or deleted since a sync token.
+
+    Query parameters:
+    - since: Token from a previous response (omit for a full initial sync)
+    - limit: Maximum number of articles per response (default: 500)
+    - lang: Return only this language, as in api_get_articles
+
+    Returns changed articles, IDs of deleted articles, the token to use next
+    and a has_more flag; repeat with the new token until has_more is false.
+    """
+    try:
+        since = int(request.args.get('since', default='0'))
+    except ValueError:
+        since = -1
+    # Sequence numbers are SQLite (signed 64-bit) integers
+    if not 0 <= since <= 2**63 - 1:
+        return jsonify({'error': 'Invalid token'}), 400
+    limit = min(max(request.args.get('limit', default=500, type=int), 1), 1000)
+    lang = request.args.get('lang')
+    if lang is not None and lang not in SUPPORTED_LANGUAGES:
+        return jsonify({'error': 'Unsupported language'}), 400
+
+    data = get_article_changes(since, limit=limit, lang=lang)
+    return jsonify({
+        'changes': data['changes'],
+        'deleted': data['deleted'],
+        'token': str(data['next_since']),
+        'has_more': data['has_more']
+    })
+
+@bp.route('/api/articles/<int:article_id>/related', methods=['GET'])
+def api_get_related_articles(article_id):
+    """Get the articles most related to this one by tech stack (optional `lang`)."""
+    lang = request.args.get('lang')
+    if lang is not None and lang not in SUPPORTED_LANGUAGES:
+        return jsonify({'error': 'Unsupported language'}), 400
+
+    related = get_related_articles(article_id, lang=lang)
+    if not related and get_article_by_id(article_id) is None:
+        return jsonify({'error': 'Article not found'}), 404
+    return jsonify(related)
+
+@bp.route('/api/articles', methods=['POST'])
 @login_required
 def api_create_article():
     """Create a new portfolio article.
@@ -157,13 +290,14 @@ def api_create_article():
     image_url = data.get('image_url')
 
     article_id = create_article(title, description, tech_stack, image_gradient, image_letter, title_en, description_en, image_url)
+    publish_if_enabled(current_app._get_current_object())
 
     return jsonify({
         'message': 'Article created successfully',
         'id': article_id
     }), 201
 
-@app.route('/api/articles/<int:article_id>', methods=['PUT'])
+@bp.route('/api/articles/<int:article_id>', methods=['PUT'])
 @login_required
 def api_update_article(article_id):
     """Update an existing portfolio article.
@@ -199,12 +333,14 @@ def api_update_article(article_id):
     if not success:
         return jsonify({'error': 'Article not found or update failed'}), 404
 
+    publish_if_enabled(current_app._get_current_object())
+
     return jsonify({
         'message': 'Article updated successfully',
         'id': article_id
     })
 
-@app.route('/api/articles/<int:article_id>', methods=['DELETE'])
+@bp.route('/api/articles/<int:article_id>', methods=['DELETE'])
 @login_required
 def api_delete_article(article_id):
     """Delete a portfolio article."""
@@ -213,14 +349,131 @@ def api_delete_article(article_id):
     if not success:
         return jsonify({'error': 'Article not found'}), 404
 
+    publish_if_enabled(current_app._get_current_object())
+
     return jsonify({
         'message': 'Article deleted successfully',
         'id': article_id
     })
 
+# HTML Fragments
+
+FRAGMENT_MAX_LIMIT = 24
+_fragment_cache = GenerationCache(maxsize=512)
+
+@bp.route('/fragments/articles', methods=['GET'])
+def article_cards_fragment():
+    """Rendered portfolio cards for the "load more" button.
+
+    Query parameters: limit (default 6), offset (default 0), lang (es/en).
+    Uses the same card macro as index(). The cards are wrapped in an element
+    whose data-has-more attribute (also sent as the X-Has-More header) tells
+    the client whether another page exists; static copies keep the attribute.
+    """
+    return _article_cards(request.args.get('limit', default=6, type=int),
+                          request.args.get('offset', default=0, type=int),
+                          request.args.get('lang', 'es'))
+
+@bp.route('/fragments/articles/page/<int:limit>/<int:offset>/<lang>.html', methods=['GET'])
+def article_cards_page(limit, offset, lang):
+    """Path form of article_cards_fragment, used by the page and the static publisher."""
+    return _article_cards(limit, offset, lang)
+
+def _article_cards(limit, offset, lang):
+    limit = min(max(limit, 1), FRAGMENT_MAX_LIMIT)
+    offset = max(offset, 0)
+    if lang not in SUPPORTED_LANGUAGES:
+        return jsonify({'error': 'Unsupported language'}), 400
+
+    def build():
+        data = get_articles_paginated(limit=limit, offset=offset)
+        html = render_template('_portfolio_cards.html', articles=data['articles'],
+                               has_more=data['has_more'], lang=lang)
+        return html.encode('utf-8'), data['has_more']
+
+    generation, (body, has_more) = _fragment_cache.get((limit, offset, lang), build)
+    response = current_app.response_class(body, mimetype='text/html')
+    response.headers['X-Has-More'] = 'true' if has_more else 'false'
+    response.set_etag(f'cards-{limit}-{offset}-{lang}-{generation}')
+    return response.make_conditional(request)
+
+# Sitemap and Feeds
+
+def _site_url() -> str:
+    return (current_app.config['SITE_URL'] or request.url_root).rstrip('/')
+
+def _xml_response(key, build, mimetype):
+    """Serve a cached XML document with ETag/Last-Modified revalidation."""
+    generation, body, last_modified = get_cached(key, build)
+    response = current_app.response_class(body, mimetype=mimetype)
+    response.set_etag(f'{key[0]}-{generation}')
+    response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
+
+@bp.route('/sitemap.xml', methods=['GET'])
+def sitemap():
+    """Sitemap with lastmod values taken from article updated_at."""
+    base_url = _site_url()
+    return _xml_response(('sitemap', base_url), lambda: build_sitemap(base_url), 'application/xml')
+
+@bp.route('/feed.xml', methods=['GET'])
+@bp.route('/en/feed.xml', defaults={'lang': 'en'}, methods=['GET'])
+def feed(lang=None):
+    """Atom feed of recently updated articles. /en/feed.xml or `lang` (es/en)."""
+    if lang is None:
+        lang = request.args.get('lang', 'es')
+    if lang not in SUPPORTED_LANGUAGES:
+        return jsonify({'error': 'Unsupported language'}), 400
+    base_url = _site_url()
+    return _xml_response((f'feed-{lang}', base_url), lambda: build_feed(base_url, lang),
+                         'application/atom+xml')
+
+# Health Endpoints
+
+# Readiness results are reused for a few seconds so frequent probes stay cheap
+READY_CACHE_SECONDS = 5
+MIN_FREE_DISK_MB = int(os.getenv('MIN_FREE_DISK_MB', 50))
+_ready_cache = {'expires': 0.0, 'status': 200, 'body': None}
+_ready_lock = threading.Lock()
+
+@bp.route('/healthz', methods=['GET'])
+def healthz():
+    """Liveness probe: the process is up and serving. No I/O."""
+    return jsonify({'status': 'ok'})
+
+@bp.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness probe: database reachable and enough free disk space.
+
+    Mail is sent synchronously, so there is no outbox to inspect; the mail
+    check only reports whether SMTP credentials are configured and does not
+    affect readiness.
+    """
+    now = time.monotonic()
+    if now >= _ready_cache['expires']:
+        with _ready_lock:
+            if now >= _ready_cache['expires']:
+                db_ok = ping_db()
+                try:
+                    free_mb = shutil.disk_usage(DATA_DIR).free // (1024 * 1024)
+                except OSError:
+                    free_mb = 0
+                disk_ok = free_mb >= MIN_FREE_DISK_MB
+                _ready_cache['body'] = {
+                    'status': 'ok' if db_ok and disk_ok else 'unavailable',
+                    'database': 'ok' if db_ok else 'error',
+                    'disk_free_mb': free_mb,
+                    'mail': 'configured' if current_app.config['MAIL_USERNAME'] else 'not_configured'
+                }
+                _ready_cache['status'] = 200 if db_ok and disk_ok else 503
+                _ready_cache['expires'] = time.monotonic() + READY_CACHE_SECONDS
+    return jsonify(_ready_cache['body']), _ready_cache['status']
+
 # Contact Form Endpoint
 
-@app.route('/api/contact', methods=['POST'])
+@bp.route('/api/contact', methods=['POST'])
 def api_contact():
     """Handle contact form submissions.
 
@@ -255,7 +508,7 @@ def api_contact():
         try:
             msg = Message(
                 subject=f'New Contact Form Submission from {name}',
-                recipients=[app.config['MAIL_RECIPIENT']],
+                recipients=[current_app.config['MAIL_RECIPIENT']],
                 body=f'''
 You have received a new message from your portfolio contact form:
 
@@ -289,5 +542,11 @@ Reply to: {email}
         print(f"Error processing contact form: {str(e)}")
         return jsonify({'error': 'An error occurred. Please try again later.'}), 500
 
+# WSGI entry point (gunicorn app:app)
+app = create_app()
+
 if __name__ == '__main__':
+    # Under gunicorn the scheduler is started per worker (see gunicorn.conf.py)
+    from maintenance import start_scheduler
+    start_scheduler()
     app.run(debug=True, host='0.0.0.0', port=5001)
@@ -0,0 +1,39 @@
+"""
+Per-process cache for content derived from articles.
+
+Entries remember the content generation they were built from (see
+database.get_content_generation) and are rebuilt on the next lookup after
+any article changes. Size is bounded with LRU eviction.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+from database import get_content_generation
+
+
+class GenerationCache:
+    """LRU cache whose entries are invalidated by content generation."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Tuple[int, Any]:
+        """Return (generation, value), calling build() only when stale or missing."""
+        generation = get_content_generation()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == generation:
+                self._entries.move_to_end(key)
+                return cached
+
+        # Built outside the lock so a slow build does not block other keys
+        cached = (generation, build())
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return cached
@@ -1,22 +1,82 @@
 import sqlite3
 import json
 import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from typing import List, Optional, Dict
 
 # Use data directory for database (better for Docker volumes)
 DATA_DIR = os.getenv('DATA_DIR', 'data')
-os.makedirs(DATA_DIR, exist_ok=True)
 DATABASE = os.path.join(DATA_DIR, 'portfolio.db')
 
-def get_db_connection():
-    """Create a database connection."""
+# One-time, per-process database setup state (see ensure_db)
+_db_ready = False
+_db_lock = threading.Lock()
+
+def _connect():
     conn = sqlite3.connect(DATABASE)
     conn.row_factory = sqlite3.Row
     return conn
 
+def ensure_db():
+    """Create the data directory and schema on first use in this process.
+
+    Cheap after the first call. Calling it in the gunicorn master before
+    forking (preload_app) means workers inherit a ready database.
+    """
+    global _db_ready
+    if _db_ready:
+        return
+    with _db_lock:
+        if _db_ready:
+            return
+        start = time.perf_counter()
+        os.makedirs(DATA_DIR, exist_ok=True)
+        if not os.path.exists(DATABASE):
+            init_db()
+        else:
+            conn = _connect()
+            _apply_migrations(conn)
+            conn.close()
+        _db_ready = True
+        print(f"Database ready (pid {os.getpid()}) in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+def reset_after_fork():
+    """Reset process-local state in a freshly forked worker.
+
+    Connections are opened per call, so none are shared across a fork. Locks
+    that may have been held by another thread at fork time are replaced, and
+    the contact writer thread (which does not survive a fork) is restarted
+    lazily on next use.
+    """
+    global _db_lock, _contact_writer, _contact_writer_lock
+    _db_lock = threading.Lock()
+    _contact_writer = None
+    _contact_writer_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=reset_after_fork)
+
+def get_db_connection():
+    """Create a database connection."""
+    ensure_db()
+    return _connect()
+
+def ping_db() -> bool:
+    """Check that the database can be opened and queried."""
+    try:
+        conn = get_db_connection()
+        conn.execute('SELECT 1').fetchone()
+        conn.close()
+        return True
+    except (sqlite3.Error, OSError):
+        return False
+
 def init_db():
     """Initialize the database with the portfolio_articles table."""
-    conn = get_db_connection()
+    os.makedirs(DATA_DIR, exist_ok=True)
+    conn = _connect()
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -24,8 +84,6 @@ def init_db():
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
             description TEXT NOT NULL,
-            title_en TEXT,
-            description_en TEXT,
             image_url TEXT,
             image_gradient TEXT DEFAULT 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
             image_letter TEXT DEFAULT '',
@@ -47,35 +105,288 @@ def init_db():
     ''')
 
     conn.commit()
+    _apply_migrations(conn)
     conn.close()
     print("Database initialized successfully!")
 
-def get_all_articles() -> List[Dict]:
+# Schema migrations
+
+def _migrate_translations(conn):
+    """Move per-language columns into the article_translations table.
+
+    Articles store their base language (Spanish) in portfolio_articles; every
+    other language is a row here. WITHOUT ROWID clusters the rows on the
+    (article_id, lang) key, so the key lookup also covers title and
+    description.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS article_translations (
+            article_id INTEGER NOT NULL,
+            lang TEXT NOT NULL,
+            title TEXT,
+            description TEXT,
+            PRIMARY KEY (article_id, lang)
+        ) WITHOUT ROWID
+    ''')
+
+    columns = [column[1] for column in conn.execute('PRAGMA table_info(portfolio_articles)')]
+    if 'title_en' in columns:
+        # Older databases stored a copy of the Spanish text when no English
+        # translation was given, and fell back on empty values too; both are
+        # dropped in favour of fallback.
+        conn.execute('''
+            INSERT OR IGNORE INTO article_translations (article_id, lang, title, description)
+            SELECT id, 'en',
+                   NULLIF(NULLIF(title_en, ''), title),
+                   NULLIF(NULLIF(description_en, ''), description)
+            FROM portfolio_articles
+            WHERE NULLIF(NULLIF(title_en, ''), title) IS NOT NULL
+               OR NULLIF(NULLIF(description_en, ''), description) IS NOT NULL
+        ''')
+        conn.execute('ALTER TABLE portfolio_articles DROP COLUMN title_en')
+        conn.execute('ALTER TABLE portfolio_articles DROP COLUMN description_en')
+
+def _migrate_content_generation(conn):
+    """Add a counter that changes whenever article content changes.
+
+    Triggers keep it current for every writer, including bulk loads, so
+    caches in any process can check freshness with one primary key read.
+    changed_at records when that happened; deletions leave no trace in
+    updated_at, so HTTP Last-Modified for derived documents (sitemap,
+    feeds) is taken from it.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS content_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL,
+            changed_at TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        INSERT OR IGNORE INTO content_generation (id, generation, changed_at)
+        VALUES (1, 0, CURRENT_TIMESTAMP)
+    ''')
+    for table in ('portfolio_articles', 'article_translations'):
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_generation
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE content_generation
+                    SET generation = generation + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE id = 1;
+                END
+            ''')
+
+def _migrate_related_articles(conn):
+    """Add the tech inverted index and the precomputed related-articles table."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS article_tech (
+            article_id INTEGER NOT NULL,
+            tech TEXT NOT NULL,
+            PRIMARY KEY (article_id, tech)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_article_tech_tech ON article_tech (tech, article_id)')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS related_articles (
+            article_id INTEGER NOT NULL,
+            related_id INTEGER NOT NULL,
+            score REAL NOT NULL,
+            PRIMARY KEY (article_id, related_id)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_related_articles_related ON related_articles (related_id)')
+    _rebuild_related_index(conn.cursor())
+
+def _migrate_article_changes(conn):
+    """Add the article change log used for delta sync, and index updated_at.
+
+    Triggers record every write (deletions included), so sync clients can
+    ask for changes after a sequence number instead of re-reading the
+    catalog. Existing articles are logged once so a sync from zero sees them.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS article_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            article_id INTEGER NOT NULL,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_article_changes_article ON article_changes (article_id, seq)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_portfolio_articles_updated_at ON portfolio_articles (updated_at)')
+
+    # Only which article changed is logged; whether it still exists is
+    # decided when changes are read
+    triggers = [
+        ('portfolio_articles', 'INSERT', 'NEW.id'),
+        ('portfolio_articles', 'UPDATE', 'NEW.id'),
+        ('portfolio_articles', 'DELETE', 'OLD.id'),
+        ('article_translations', 'INSERT', 'NEW.article_id'),
+        ('article_translations', 'UPDATE', 'NEW.article_id'),
+        ('article_translations', 'DELETE', 'OLD.article_id'),
+    ]
+    for table, event, article_id in triggers:
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_changes
+            AFTER {event} ON {table}
+            BEGIN
+                INSERT INTO article_changes (article_id) VALUES ({article_id});
+            END
+        ''')
+
+    conn.execute('''
+        INSERT INTO article_changes (article_id)
+        SELECT id FROM portfolio_articles ORDER BY id
+    ''')
+
+# Applied in order; PRAGMA user_version records how many have run
+MIGRATIONS = [
+    _migrate_translations,
+    _migrate_content_generation,
+    _migrate_related_articles,
+    _migrate_article_changes,
+]
+
+# How long a starting process waits for another one's migrations
+MIGRATION_BUSY_TIMEOUT_MS = 10 * 60 * 1000
+
+def _apply_migrations(conn):
+    """Bring the schema up to date. Cheap when nothing is pending.
+
+    Each migration runs in its own BEGIN IMMEDIATE transaction together with
+    its user_version bump, so a crash never leaves one half applied, and a
+    process starting alongside another waits and re-checks the version
+    instead of applying the same migration twice.
+    """
+    if conn.execute('PRAGMA user_version').fetchone()[0] >= len(MIGRATIONS):
+        return
+    # Another process may be in the middle of a long migration (e.g. the
+    # related-articles rebuild); wait for it rather than fail
+    conn.execute(f'PRAGMA busy_timeout = {MIGRATION_BUSY_TIMEOUT_MS}')
+    while True:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version >= len(MIGRATIONS):
+                conn.rollback()
+                return
+            MIGRATIONS[version](conn)
+            conn.execute(f'PRAGMA user_version = {version + 1}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        print(f"Applied database migration {version + 1}: {MIGRATIONS[version].__name__}")
+
+class Article:
+    """Portfolio article record built directly from a database row.
+
+    Uses __slots__ to keep per-row allocations small. The tech stack is
+    stored as the raw JSON text from the database and only decoded when
+    accessed, so serializers can embed it without a decode/encode round trip.
+
+    A record read for a single language has `lang` set and its title and
+    description already resolved to that language; otherwise it carries the
+    base language plus the English translation in title_en/description_en.
+    """
+    __slots__ = ('id', 'title', 'description', 'title_en', 'description_en',
+                 'image_url', 'image_gradient', 'image_letter',
+                 'tech_stack_json', 'created_at', 'updated_at', 'lang', '_tech_stack')
+
+    def __init__(self, id, title, description, title_en, description_en,
+                 image_url, image_gradient, image_letter, tech_stack_json,
+                 created_at, updated_at, lang=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.title_en = title_en
+        self.description_en = description_en
+        self.image_url = image_url
+        self.image_gradient = image_gradient
+        self.image_letter = image_letter
+        self.tech_stack_json = tech_stack_json or '[]'
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.lang = lang
+        self._tech_stack = None
+
+    @property
+    def tech_stack(self) -> List[str]:
+        if self._tech_stack is None:
+            self._tech_stack = json.loads(self.tech_stack_json)
+        return self._tech_stack
+
+    def to_dict(self, tech_stack=None) -> Dict:
+        """Plain dict for JSON output. `tech_stack` overrides the decoded list."""
+        data = {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description
+        }
+        if self.lang is None:
+            data['title_en'] = self.title_en
+            data['description_en'] = self.description_en
+        else:
+            data['lang'] = self.lang
+        data['image_url'] = self.image_url
+        data['image_gradient'] = self.image_gradient
+        data['image_letter'] = self.image_letter
+        data['tech_stack'] = self.tech_stack if tech_stack is None else tech_stack
+        data['created_at'] = self.created_at
+        data['updated_at'] = self.updated_at
+        return data
+
+# Languages served by the API; the base language lives in portfolio_articles
+DEFAULT_LANGUAGE = 'es'
+SUPPORTED_LANGUAGES = ('es', 'en')
+
+# Column order must match Article.__init__. Missing or empty translations
+# fall back to the base language in SQL.
+_BILINGUAL_SELECT = '''
+    SELECT a.id, a.title, a.description,
+           COALESCE(NULLIF(t.title, ''), a.title),
+           COALESCE(NULLIF(t.description, ''), a.description),
+           a.image_url, a.image_gradient, a.image_letter, a.tech_stack,
+           a.created_at, a.updated_at
+    FROM portfolio_articles a
+    LEFT JOIN article_translations t ON t.article_id = a.id AND t.lang = 'en'
+'''
+
+_LOCALIZED_SELECT = '''
+    SELECT a.id, COALESCE(NULLIF(t.title, ''), a.title),
+           COALESCE(NULLIF(t.description, ''), a.description),
+           NULL, NULL,
+           a.image_url, a.image_gradient, a.image_letter, a.tech_stack,
+           a.created_at, a.updated_at, ?
+    FROM portfolio_articles a
+    LEFT JOIN article_translations t ON t.article_id = a.id AND t.lang = ?
+'''
+
+def article_factory(cursor, row) -> Article:
+    """sqlite3 row_factory that builds Article records from article selects."""
+    return Article(*row)
+
+def _query_articles(conn, lang: Optional[str], where: str = '', params=()) -> sqlite3.Cursor:
+    """Run an article select for `lang` (both languages when None)."""
+    if lang is None:
+        sql, select_params = _BILINGUAL_SELECT, ()
+    else:
+        sql, select_params = _LOCALIZED_SELECT, (lang, lang)
+    cursor = conn.cursor()
+    cursor.row_factory = article_factory
+    return cursor.execute(sql + where, select_params + tuple(params))
+
+def get_all_articles(lang: Optional[str] = None) -> List[Article]:
     """Get all portfolio articles."""
     conn = get_db_connection()
-    articles = conn.execute('SELECT * FROM portfolio_articles ORDER BY created_at DESC').fetchall()
+    articles = _query_articles(conn, lang, 'ORDER BY a.created_at DESC').fetchall()
     conn.close()
 
-    result = []
-    for article in articles:
-        result.append({
-            'id': article['id'],
-            'title': article['title'],
-            'description': article['description'],
-            'title_en': article['title_en'] if article['title_en'] else article['title'],
-            'description_en': article['description_en'] if article['description_en'] else article['description'],
-            'image_url': article['image_url'],
-            'image_gradient': article['image_gradient'],
-            'image_letter': article['image_letter'],
-            'tech_stack': json.loads(article['tech_stack']) if article['tech_stack'] else [],
-            'created_at': article['created_at'],
-            'updated_at': article['updated_at']
-        })
+    return articles
 
-    return result
 
-
-def get_articles_paginated(limit: int = 6, offset: int = 0) -> Dict:
+def get_articles_paginated(limit: int = 6, offset: int = 0, lang: Optional[str] = None) -> Dict:
     """Get portfolio articles with pagination."""
     conn = get_db_connection()
 
@@ -83,57 +394,144 @@ def get_articles_paginated(limit: int = 6, offset: int = 0) -> Dict:
     total = conn.execute('SELECT COUNT(*) FROM portfolio_articles').fetchone()[0]
 
     # Get paginated articles
-    articles = conn.execute(
-        'SELECT * FROM portfolio_articles ORDER BY created_at DESC LIMIT ? OFFSET ?',
-        (limit, offset)
+    articles = _query_articles(
+        conn, lang, 'ORDER BY a.created_at DESC LIMIT ? OFFSET ?', (limit, offset)
     ).fetchall()
     conn.close()
 
-    result = []
-    for article in articles:
-        result.append({
-            'id': article['id'],
-            'title': article['title'],
-            'description': article['description'],
-            'title_en': article['title_en'] if article['title_en'] else article['title'],
-            'description_en': article['description_en'] if article['description_en'] else article['description'],
-            'image_url': article['image_url'],
-            'image_gradient': article['image_gradient'],
-            'image_letter': article['image_letter'],
-            'tech_stack': json.loads(article['tech_stack']) if article['tech_stack'] else [],
-            'created_at': article['created_at'],
-            'updated_at': article['updated_at']
-        })
-
     return {
-        'articles': result,
+        'articles': articles,
         'total': total,
         'has_more': offset + limit < total
     }
 
-def get_article_by_id(article_id: int) -> Optional[Dict]:
+def get_article_by_id(article_id: int, lang: Optional[str] = None) -> Optional[Article]:
     """Get a single portfolio article by ID."""
     conn = get_db_connection()
-    article = conn.execute('SELECT * FROM portfolio_articles WHERE id = ?', (article_id,)).fetchone()
+    article = _query_articles(conn, lang, 'WHERE a.id = ?', (article_id,)).fetchone()
     conn.close()
 
-    if article is None:
-        return None
+    return article
+
+def get_recently_updated_articles(limit: int, lang: Optional[str] = None) -> List[Article]:
+    """Get the most recently updated articles, newest first."""
+    conn = get_db_connection()
+    articles = _query_articles(conn, lang, 'ORDER BY a.updated_at DESC LIMIT ?', (limit,)).fetchall()
+    conn.close()
+
+    return articles
+
+def get_article_lastmods(limit: int) -> List[tuple]:
+    """Get (id, updated_at) for the most recently updated articles."""
+    conn = get_db_connection()
+    rows = conn.execute(
+        'SELECT id, updated_at FROM portfolio_articles ORDER BY updated_at DESC LIMIT ?', (limit,)
+    ).fetchall()
+    conn.close()
+
+    return [tuple(row) for row in rows]
+
+def get_content_generation() -> int:
+    """Counter that increases on every article or translation change."""
+    conn = get_db_connection()
+    generation = conn.execute('SELECT generation FROM content_generation WHERE id = 1').fetchone()[0]
+    conn.close()
+
+    return generation
+
+def get_content_changed_at() -> str:
+    """UTC timestamp of the last article or translation change (including deletions)."""
+    conn = get_db_connection()
+    changed_at = conn.execute('SELECT changed_at FROM content_generation WHERE id = 1').fetchone()[0]
+    conn.close()
+
+    return changed_at
+
+def get_article_changes(since: int, limit: int = 500, lang: Optional[str] = None) -> Dict:
+    """Get articles changed after change sequence `since`.
 
+    Returns the current version of each created or updated article, the IDs
+    of deleted articles, the sequence to pass as `since` next time, and
+    whether more changes are pending. An article is reported once, however
+    many times it changed.
+    """
+    conn = get_db_connection()
+
+    # Articles are ordered by their latest change, so everything up to the
+    # returned sequence is fully covered even when the result is cut off.
+    latest = conn.execute('''
+        SELECT article_id, MAX(seq) AS last_seq
+        FROM article_changes
+        WHERE seq > ?
+        GROUP BY article_id
+        ORDER BY last_seq
+        LIMIT ?
+    ''', (since, limit + 1)).fetchall()
+
+    has_more = len(latest) > limit
+    latest = latest[:limit]
+    ids = [row['article_id'] for row in latest]
+
+    articles = []
+    if ids:
+        placeholders = ', '.join('?' * len(ids))
+        articles = _query_articles(
+            conn, lang, f'WHERE a.id IN ({placeholders}) ORDER BY a.id', ids
+        ).fetchall()
+    conn.close()
+
+    existing = {article.id for article in articles}
     return {
-        'id': article['id'],
-        'title': article['title'],
-        'description': article['description'],
-        'title_en': article['title_en'] if article['title_en'] else article['title'],
-        'description_en': article['description_en'] if article['description_en'] else article['description'],
-        'image_url': article['image_url'],
-        'image_gradient': article['image_gradient'],
-        'image_letter': article['image_letter'],
-        'tech_stack': json.loads(article['tech_stack']) if article['tech_stack'] else [],
-        'created_at': article['created_at'],
-        'updated_at': article['updated_at']
+        'changes': articles,
+        'deleted': [article_id for article_id in ids if article_id not in existing],
+        'next_since': latest[-1]['last_seq'] if latest else since,
+        'has_more': has_more
     }
 
+def compact_article_changes() -> int:
+    """Drop change log rows superseded by a later change to the same article.
+
+    Sync results only depend on each article's latest change, so every
+    previously issued sequence number stays valid. Returns rows removed.
+    """
+    conn = get_db_connection()
+    cursor = conn.execute('''
+        DELETE FROM article_changes
+        WHERE seq NOT IN (SELECT MAX(seq) FROM article_changes GROUP BY article_id)
+    ''')
+    removed = cursor.rowcount
+    conn.commit()
+    conn.close()
+
+    return removed
+
+def _upsert_translation(cursor, article_id: int, lang: str,
+                        title: Optional[str], description: Optional[str]):
+    # A None field keeps the stored value (or falls back to the base language)
+    cursor.execute('''
+        INSERT INTO article_translations (article_id, lang, title, description)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (article_id, lang) DO UPDATE SET
+            title = COALESCE(excluded.title, title),
+            description = COALESCE(excluded.description, description)
+    ''', (article_id, lang, title, description))
+
+def set_article_translation(article_id: int, lang: str, title: str = None,
+                            description: str = None) -> bool:
+    """Add or update one language version of an article."""
+    if lang == DEFAULT_LANGUAGE:
+        raise ValueError(f"'{lang}' is the base language; use update_article instead")
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    exists = cursor.execute('SELECT 1 FROM portfolio_articles WHERE id = ?', (article_id,)).fetchone()
+    if exists:
+        _upsert_translation(cursor, article_id, lang, title, description)
+        conn.commit()
+    conn.close()
+
+    return exists is not None
+
 def create_article(title: str, description: str, tech_stack: List[str],
                   image_gradient: str = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
                   image_letter: str = '',
@@ -144,18 +542,19 @@ def create_article(title: str, description: str, tech_stack: List[str],
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    # If English translations not provided, use Spanish as fallback
-    if title_en is None:
-        title_en = title
-    if description_en is None:
-        description_en = description
-
     cursor.execute('''
-        INSERT INTO portfolio_articles (title, description, title_en, description_en, image_url, image_gradient, image_letter, tech_stack)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (title, description, title_en, description_en, image_url, image_gradient, image_letter, json.dumps(tech_stack)))
+        INSERT INTO portfolio_articles (title, description, image_url, image_gradient, image_letter, tech_stack)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', (title, description, image_url, image_gradient, image_letter, json.dumps(tech_stack)))
 
     article_id = cursor.lastrowid
+
+    # Without an English translation, reads fall back to Spanish
+    if title_en is not None or description_en is not None:
+        _upsert_translation(cursor, article_id, 'en', title_en, description_en)
+
+    _refresh_related(cursor, article_id)
+
     conn.commit()
     conn.close()
 
@@ -173,14 +572,6 @@ def update_article(article_id: int, title: str, description: str, tech_stack: Li
     update_fields = ['title = ?', 'description = ?', 'tech_stack = ?']
     values = [title, description, json.dumps(tech_stack)]
 
-    if title_en is not None:
-        update_fields.append('title_en = ?')
-        values.append(title_en)
-
-    if description_en is not None:
-        update_fields.append('description_en = ?')
-        values.append(description_en)
-
     if image_url is not None:
         update_fields.append('image_url = ?')
         values.append(image_url)
@@ -203,9 +594,14 @@ def update_article(article_id: int, title: str, description: str, tech_stack: Li
     '''
 
     cursor.execute(sql, values)
+    affected = cursor.rowcount
+
+    if affected > 0:
+        if title_en is not None or description_en is not None:
+            _upsert_translation(cursor, article_id, 'en', title_en, description_en)
+        _refresh_related(cursor, article_id)
 
     conn.commit()
-    affected = cursor.rowcount
     conn.close()
 
     return affected > 0
@@ -216,30 +612,301 @@ def delete_article(article_id: int) -> bool:
     cursor = conn.cursor()
 
     cursor.execute('DELETE FROM portfolio_articles WHERE id = ?', (article_id,))
+    affected = cursor.rowcount
+    cursor.execute('DELETE FROM article_translations WHERE article_id = ?', (article_id,))
+    if affected > 0:
+        _remove_related(cursor, article_id)
 
     conn.commit()
-    affected = cursor.rowcount
     conn.close()
 
     return affected > 0
 
-# Contact Messages Functions
-
-def create_contact_message(name: str, email: str, message: str) -> int:
-    """Create a new contact message."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
+# Related Articles
+#
+# related_articles holds each article's RELATED_LIMIT most similar articles,
+# by Jaccard similarity of their tech stacks (ties go to the newer article).
+# Candidates are the RELATED_CANDIDATES_PER_TECH newest articles of each of
+# the article's technologies, so computing one list costs the same however
+# many articles share a technology.
+#
+# Every write recomputes the changed article's list, recomputes up to
+# RELATED_MAX_UPDATES lists that included it and merges it into up to
+# RELATED_MAX_UPDATES lists of its best candidates. Lists past those caps
+# may be slightly stale until the next rebuild_related_index().
+
+RELATED_LIMIT = 4
+RELATED_CANDIDATES_PER_TECH = 20
+RELATED_MAX_UPDATES = 50
+
+# Scored candidates for the articles selected by {sources}, a query
+# returning article ids. Shared-tech counts are exact, not just the
+# techs through which the candidate was found.
+_RELATED_CANDIDATES = '''
+    WITH sources AS ({sources}),
+    cutoff AS (
+        SELECT t.tech, COALESCE((
+            SELECT c.article_id FROM article_tech c WHERE c.tech = t.tech
+            ORDER BY c.article_id DESC LIMIT 1 OFFSET :candidates - 1
+        ), 0) AS min_id
+        FROM (SELECT DISTINCT tech FROM article_tech WHERE article_id IN sources) t
+    ),
+    pairs AS (
+        SELECT DISTINCT a.article_id, b.article_id AS related_id
+        FROM article_tech a
+        JOIN cutoff k ON k.tech = a.tech
+        JOIN article_tech b ON b.tech = a.tech AND b.article_id >= k.min_id
+        WHERE a.article_id IN sources AND b.article_id != a.article_id
+    ),
+    counted AS MATERIALIZED (
+        SELECT p.article_id, p.related_id,
+               (SELECT COUNT(*) FROM article_tech x
+                JOIN article_tech y ON y.article_id = p.related_id AND y.tech = x.tech
+                WHERE x.article_id = p.article_id) AS shared,
+               (SELECT COUNT(*) FROM article_tech WHERE article_id = p.article_id) AS own,
+               (SELECT COUNT(*) FROM article_tech WHERE article_id = p.related_id) AS other
+        FROM pairs p
+    ),
+    scored AS (
+        SELECT article_id, related_id, shared * 1.0 / (own + other - shared) AS score
+        FROM counted
+    )
+'''
+
+# Top RELATED_LIMIT candidates per source article
+_TOP_RELATED = _RELATED_CANDIDATES + '''
+    SELECT article_id, related_id, score FROM (
+        SELECT article_id, related_id, score,
+               ROW_NUMBER() OVER (PARTITION BY article_id
+                                  ORDER BY score DESC, related_id DESC) AS rank
+        FROM scored
+    )
+    WHERE rank <= :limit
+'''
+
+def _related_params() -> Dict:
+    return {'candidates': RELATED_CANDIDATES_PER_TECH, 'limit': RELATED_LIMIT}
+
+def _recompute_related(cursor, article_ids: List[int]):
+    """Recompute the related lists of the given articles in one statement."""
+    if not article_ids:
+        return
+    ids = json.dumps(article_ids)
+    cursor.execute('DELETE FROM related_articles WHERE article_id IN (SELECT value FROM json_each(?))', (ids,))
+    cursor.execute(
+        'INSERT INTO related_articles (article_id, related_id, score) '
+        + _TOP_RELATED.format(sources='SELECT value FROM json_each(:ids)'),
+        {'ids': ids, **_related_params()}
+    )
+
+def _merge_related(cursor, article_id: int, skip: List[int]):
+    """Merge an article into its best candidates' lists, trimming each back
+    to RELATED_LIMIT. Lists in `skip` were already recomputed."""
+    params = {'id': article_id, 'skip': json.dumps(skip), 'updates': RELATED_MAX_UPDATES,
+              **_related_params()}
+    # Jaccard is symmetric, so the article's own candidate scores apply both ways
+    targets = [row[0] for row in cursor.execute(
+        _RELATED_CANDIDATES.format(sources='SELECT :id') + '''
+        SELECT related_id FROM scored
+        WHERE related_id NOT IN (SELECT value FROM json_each(:skip))
+        ORDER BY score DESC, related_id DESC
+        LIMIT :updates
+        ''', params
+    ).fetchall()]
+    if not targets:
+        return
+    params['targets'] = json.dumps(targets)
+    cursor.execute(
+        'INSERT OR REPLACE INTO related_articles (article_id, related_id, score) '
+        + _RELATED_CANDIDATES.format(sources='SELECT :id') + '''
+        SELECT related_id, article_id, score FROM scored
+        WHERE related_id IN (SELECT value FROM json_each(:targets))
+        ''', params
+    )
     cursor.execute('''
-        INSERT INTO contact_messages (name, email, message)
-        VALUES (?, ?, ?)
-    ''', (name, email, message))
+        DELETE FROM related_articles
+        WHERE (article_id, related_id) IN (
+            SELECT article_id, related_id FROM (
+                SELECT article_id, related_id,
+                       ROW_NUMBER() OVER (PARTITION BY article_id
+                                          ORDER BY score DESC, related_id DESC) AS rank
+                FROM related_articles
+                WHERE article_id IN (SELECT value FROM json_each(:targets))
+            )
+            WHERE rank > :limit
+        )
+    ''', params)
 
-    message_id = cursor.lastrowid
+def _index_tech_stack(cursor, article_id: int):
+    cursor.execute('DELETE FROM article_tech WHERE article_id = ?', (article_id,))
+    cursor.execute('''
+        INSERT OR IGNORE INTO article_tech (article_id, tech)
+        SELECT a.id, lower(trim(j.value))
+        FROM portfolio_articles a, json_each(a.tech_stack) j
+        WHERE a.id = ? AND trim(j.value) != ''
+    ''', (article_id,))
+
+def _listed_by(cursor, article_id: int) -> List[int]:
+    """Up to RELATED_MAX_UPDATES articles whose lists include this one, newest first."""
+    return [row[0] for row in cursor.execute('''
+        SELECT article_id FROM related_articles WHERE related_id = ?
+        ORDER BY article_id DESC LIMIT ?
+    ''', (article_id, RELATED_MAX_UPDATES)).fetchall()]
+
+def _refresh_related(cursor, article_id: int):
+    """Update the related index after an article was created or changed."""
+    _index_tech_stack(cursor, article_id)
+    # Lists that included it may need to drop or reorder it
+    listed_by = _listed_by(cursor, article_id)
+    _recompute_related(cursor, [article_id] + listed_by)
+    _merge_related(cursor, article_id, skip=listed_by)
+
+def _remove_related(cursor, article_id: int):
+    """Update the related index after an article was deleted."""
+    cursor.execute('DELETE FROM article_tech WHERE article_id = ?', (article_id,))
+    cursor.execute('DELETE FROM related_articles WHERE article_id = ?', (article_id,))
+    listed_by = _listed_by(cursor, article_id)
+    # Lists past the cap just shrink by one until the next rebuild
+    cursor.execute('DELETE FROM related_articles WHERE related_id = ?', (article_id,))
+    _recompute_related(cursor, listed_by)
+
+def _rebuild_related_index(cursor):
+    """Recompute the whole index with one set-based statement."""
+    cursor.execute('DELETE FROM article_tech')
+    cursor.execute('''
+        INSERT OR IGNORE INTO article_tech (article_id, tech)
+        SELECT a.id, lower(trim(j.value))
+        FROM portfolio_articles a, json_each(a.tech_stack) j
+        WHERE trim(j.value) != ''
+    ''')
+    # Posting list sizes steer the plan below; refresh them after a bulk change
+    cursor.execute('ANALYZE article_tech')
+    cursor.execute('DELETE FROM related_articles')
+    cursor.execute(
+        'INSERT INTO related_articles (article_id, related_id, score) '
+        + _TOP_RELATED.format(sources='SELECT id FROM portfolio_articles'),
+        _related_params()
+    )
+
+def rebuild_related_index():
+    """Recompute related articles for every article (e.g. after a bulk load)."""
+    conn = get_db_connection()
+    _rebuild_related_index(conn.cursor())
     conn.commit()
     conn.close()
 
-    return message_id
+def get_related_articles(article_id: int, lang: Optional[str] = None) -> List[Article]:
+    """Get the precomputed most related articles, best match first."""
+    conn = get_db_connection()
+    articles = _query_articles(conn, lang, '''
+        JOIN related_articles r ON r.related_id = a.id
+        WHERE r.article_id = ?
+        ORDER BY r.score DESC, r.related_id DESC
+    ''', (article_id,)).fetchall()
+    conn.close()
+
+    return articles
+
+# Contact Messages Functions
+
+# Group commit: concurrent submissions are queued and written by a single
+# thread, which coalesces everything pending into one transaction. A batch
+# is flushed after GROUP_COMMIT_WINDOW_MS or once it holds GROUP_COMMIT_MAX_ROWS.
+GROUP_COMMIT_WINDOW_MS = 5
+GROUP_COMMIT_MAX_ROWS = 100
+
+class _ContactWriter:
+    """Background writer that batches contact message inserts."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='contact-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, name: str, email: str, message: str) -> Future:
+        future = Future()
+        self._queue.put(((name, email, message), future))
+        return future
+
+    def _next_batch(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + GROUP_COMMIT_WINDOW_MS / 1000
+        while len(batch) < GROUP_COMMIT_MAX_ROWS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _commit(self, conn, batch: list):
+        """Insert the batch in one transaction, then resolve its futures."""
+        cursor = conn.cursor()
+        ids = []
+        for values, _ in batch:
+            cursor.execute('''
+                INSERT INTO contact_messages (name, email, message)
+                VALUES (?, ?, ?)
+            ''', values)
+            ids.append(cursor.lastrowid)
+        conn.commit()
+
+        # Results are only published after the commit is durable
+        for (_, future), message_id in zip(batch, ids):
+            future.set_result(message_id)
+
+    def _run(self):
+        conn = None
+        while True:
+            batch = self._next_batch()
+            try:
+                if conn is None:
+                    conn = get_db_connection()
+                try:
+                    self._commit(conn, batch)
+                except sqlite3.IntegrityError:
+                    # One invalid row rolls back the whole batch; retry the
+                    # rows one at a time so only that row's caller fails.
+                    conn.rollback()
+                    for item in batch:
+                        try:
+                            self._commit(conn, [item])
+                        except sqlite3.IntegrityError as e:
+                            conn.rollback()
+                            item[1].set_exception(e)
+            except Exception as e:
+                # Fail every caller still waiting and reconnect for the next batch
+                if conn is not None:
+                    try:
+                        conn.rollback()
+                        conn.close()
+                    except sqlite3.Error:
+                        pass
+                    conn = None
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+_contact_writer = None
+_contact_writer_lock = threading.Lock()
+
+def _get_contact_writer() -> _ContactWriter:
+    global _contact_writer
+    if _contact_writer is None:
+        with _contact_writer_lock:
+            if _contact_writer is None:
+                _contact_writer = _ContactWriter()
+    return _contact_writer
+
+def create_contact_message(name: str, email: str, message: str) -> int:
+    """Create a new contact message.
+
+    Blocks until the batch containing the message has been committed and
+    returns the new row id.
+    """
+    return _get_contact_writer().submit(name, email, message).result()
 
 def get_all_contact_messages() -> List[Dict]:
     """Get all contact messages."""
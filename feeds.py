@@ -0,0 +1,106 @@
+"""
+Sitemap and Atom feed generation for crawlers and feed readers.
+
+Documents are rendered from portfolio_articles and cached per process
+with a GenerationCache, so they are only rebuilt after an article changes.
+Their HTTP Last-Modified is the time of the last content change, so a
+deletion also invalidates copies held by clients that only send
+If-Modified-Since.
+"""
+from datetime import datetime, timezone
+from typing import Callable, Tuple
+from xml.sax.saxutils import escape
+
+from content_cache import GenerationCache
+from database import get_article_lastmods, get_content_changed_at, get_recently_updated_articles
+
+# The sitemap protocol allows at most 50,000 URLs per file
+SITEMAP_MAX_URLS = 50_000
+FEED_MAX_ENTRIES = 50
+
+FEED_TITLES = {
+    'es': 'Hernán Thiers - Proyectos',
+    'en': 'Hernán Thiers - Projects'
+}
+
+_cache = GenerationCache(maxsize=16)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    # SQLite CURRENT_TIMESTAMP values are UTC 'YYYY-MM-DD HH:MM:SS'
+    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+
+
+def _isoformat(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _content_changed_at() -> datetime:
+    # Read before the content, so a concurrent change can only make the
+    # reported time older than the document, never newer
+    changed_at = get_content_changed_at()
+    return _parse_timestamp(changed_at) if changed_at else datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def build_sitemap(base_url: str) -> Tuple[bytes, datetime]:
+    """Render sitemap.xml. Returns the document and its last modification time."""
+    last_modified = _content_changed_at()
+    lastmods = get_article_lastmods(SITEMAP_MAX_URLS - 2)
+    newest = _parse_timestamp(lastmods[0][1]) if lastmods else datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    ]
+    for path in ('/', '/en/'):
+        parts.append(f'<url><loc>{escape(base_url + path)}</loc>'
+                     f'<lastmod>{_isoformat(newest)}</lastmod></url>\n')
+    for article_id, updated_at in lastmods:
+        parts.append(f'<url><loc>{escape(base_url)}/api/articles/{article_id}.json</loc>'
+                     f'<lastmod>{_isoformat(_parse_timestamp(updated_at))}</lastmod></url>\n')
+    parts.append('</urlset>\n')
+
+    return ''.join(parts).encode('utf-8'), last_modified
+
+
+def build_feed(base_url: str, lang: str) -> Tuple[bytes, datetime]:
+    """Render the Atom feed for one language."""
+    last_modified = _content_changed_at()
+    articles = get_recently_updated_articles(FEED_MAX_ENTRIES, lang=lang)
+    newest = _parse_timestamp(articles[0].updated_at) if articles else datetime(1970, 1, 1, tzinfo=timezone.utc)
+    # Path-only URLs, so they also resolve on a static publish
+    prefix = '' if lang == 'es' else f'/{lang}'
+    home = f'{base_url}{prefix}/'
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="{lang}">\n'
+        f'<id>{escape(home)}</id>\n'
+        f'<title>{escape(FEED_TITLES.get(lang, FEED_TITLES["es"]))}</title>\n'
+        f'<updated>{_isoformat(newest)}</updated>\n'
+        f'<link rel="alternate" href="{escape(home)}"/>\n'
+        f'<link rel="self" href="{escape(base_url)}{prefix}/feed.xml"/>\n'
+        '<author><name>Hernán Thiers</name></author>\n'
+    ]
+    for article in articles:
+        url = f'{base_url}/api/articles/{article.id}.json'
+        parts.append(
+            '<entry>'
+            f'<id>{escape(url)}</id>'
+            f'<title>{escape(article.title)}</title>'
+            f'<link rel="alternate" href="{escape(url)}"/>'
+            f'<published>{_isoformat(_parse_timestamp(article.created_at))}</published>'
+            f'<updated>{_isoformat(_parse_timestamp(article.updated_at))}</updated>'
+            f'<summary>{escape(article.description)}</summary>'
+            + ''.join(f'<category term="{escape(tech)}"/>' for tech in article.tech_stack)
+            + '</entry>\n'
+        )
+    parts.append('</feed>\n')
+
+    return ''.join(parts).encode('utf-8'), last_modified
+
+
+def get_cached(key: Tuple, build: Callable[[], Tuple[bytes, datetime]]) -> Tuple[int, bytes, datetime]:
+    """Return (generation, body, last_modified), rebuilding only after content changes."""
+    generation, (body, last_modified) = _cache.get(key, build)
+    return generation, body, last_modified
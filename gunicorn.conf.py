@@ -0,0 +1,115 @@
+"""
+Gunicorn configuration sized from the container's CPU and memory limits.
+
+Usage:  gunicorn -c gunicorn.conf.py app:app
+
+Environment overrides: PORT, WEB_WORKERS, WEB_THREADS, WORKER_CLASS,
+WORKER_MEMORY_MB, ASYNC_CONTACT.
+"""
+import os
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit() -> float:
+    """CPUs available to this process, honouring cgroup quotas and affinity."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    quota = _read('/sys/fs/cgroup/cpu.max')
+    if quota and not quota.startswith('max'):
+        limit, period = quota.split()
+        return min(cpus, int(limit) / int(period))
+
+    # cgroup v1: quota is -1 when unlimited
+    limit = _read('/sys/fs/cgroup/cpu/cpu.cfs_quota_us')
+    period = _read('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+    if limit and period and int(limit) > 0:
+        return min(cpus, int(limit) / int(period))
+
+    return cpus
+
+
+def memory_limit_mb():
+    """Memory limit in MB from cgroups, or None when unlimited."""
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        value = _read(path)
+        # cgroup v1 reports "unlimited" as a huge number
+        if value and value != 'max' and int(value) < 1 << 60:
+            return int(value) // (1024 * 1024)
+    return None
+
+
+def _async_worker_class():
+    try:
+        import gevent  # noqa: F401
+    except ImportError:
+        return None
+    return 'gevent'
+
+
+cpus = cpu_limit()
+memory_mb = memory_limit_mb()
+worker_memory_mb = int(os.getenv('WORKER_MEMORY_MB', 80))
+
+# Contact submissions block on SMTP; with ASYNC_CONTACT=True and gevent
+# installed, cooperative workers let one process hold many slow requests.
+worker_class = os.getenv('WORKER_CLASS') or (
+    os.getenv('ASYNC_CONTACT', 'False') == 'True' and _async_worker_class()
+) or 'gthread'
+
+cpu_workers = 2 * max(1, round(cpus)) + 1
+workers = cpu_workers
+if memory_mb:
+    # Leave a quarter of the limit for the master and page cache
+    workers = min(workers, max(1, int(memory_mb * 0.75) // worker_memory_mb))
+workers = int(os.getenv('WEB_WORKERS', workers))
+
+# Threads are cheap compared to processes; when memory caps the worker count,
+# give each worker more threads to keep the same request concurrency.
+threads = int(os.getenv('WEB_THREADS', min(16, max(4, -(-cpu_workers * 4 // workers)))))
+worker_connections = 200
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Load the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+# Recycle workers periodically; jitter keeps them from restarting together
+max_requests = 1000
+max_requests_jitter = 100
+
+accesslog = '-'
+errorlog = '-'
+
+
+# Hooks import the app's modules lazily: the config file is loaded before
+# gunicorn puts the app directory on sys.path.
+
+def when_ready(server):
+    import database
+
+    # Create/migrate the database once in the master; forked workers inherit it
+    database.ensure_db()
+    server.log.info(
+        f"Sized for {cpus:g} CPUs, memory limit {memory_mb or 'unlimited'} MB: "
+        f"{workers} {worker_class} workers x {threads} threads"
+    )
+
+
+def post_fork(server, worker):
+    import maintenance
+
+    # database resets its own locks and writer thread via os.register_at_fork.
+    # Threads are only started in workers: the master forks replacements
+    # at any time, and a fork during a backup or VACUUM can deadlock the child
+    maintenance.start_scheduler()
@@ -0,0 +1,206 @@
+"""
+Online backup and routine maintenance for the SQLite database.
+
+Backups use the sqlite3 backup API, copying a few pages per step and
+sleeping between steps, so writers are never blocked for long and the copy
+is always consistent. Maintenance checkpoints the WAL (when in WAL mode),
+compacts the article change log, rebuilds the related-articles index
+(catching up lists the per-write updates skipped), runs PRAGMA optimize
+and reclaims free pages with incremental vacuum.
+
+Run manually:
+    python maintenance.py                # backup + maintenance
+    python maintenance.py backup
+    python maintenance.py maintain
+    python maintenance.py enable-incremental-vacuum   # one-time, rewrites the file
+
+Or set MAINTENANCE_INTERVAL_HOURS to run both on a schedule inside the app
+(started in each gunicorn worker by gunicorn.conf.py, or by python app.py).
+"""
+import argparse
+import fcntl
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Tuple
+
+from database import DATA_DIR, get_db_connection, compact_article_changes, rebuild_related_index
+
+BACKUP_DIR = os.getenv('BACKUP_DIR', os.path.join(DATA_DIR, 'backups'))
+BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', 7))
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.005
+MAINTENANCE_INTERVAL_HOURS = float(os.getenv('MAINTENANCE_INTERVAL_HOURS', 0))
+LOCK_PATH = os.path.join(DATA_DIR, 'maintenance.lock')
+LAST_RUN_PATH = os.path.join(DATA_DIR, 'maintenance.last')
+# How often scheduler threads check whether maintenance is due
+SCHEDULER_TICK_SECONDS = 60
+
+# (step, seconds, details)
+Report = List[Tuple[str, float, str]]
+
+
+def _database_bytes(conn) -> Tuple[int, int]:
+    """(file size, free-list size) in bytes."""
+    page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+    page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    freelist = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    return page_count * page_size, freelist * page_size
+
+
+def backup(report: Report) -> str:
+    """Take an online backup into BACKUP_DIR and prune old backups."""
+    start = time.perf_counter()
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+    name = time.strftime('portfolio-%Y%m%d-%H%M%S.db')
+    target = os.path.join(BACKUP_DIR, name)
+    tmp_target = target + '.tmp'
+
+    source = get_db_connection()
+    dest = sqlite3.connect(tmp_target)
+    try:
+        source.backup(dest, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP)
+    finally:
+        dest.close()
+        source.close()
+    # Only complete backups ever carry the final name
+    os.replace(tmp_target, target)
+
+    backups = sorted(f for f in os.listdir(BACKUP_DIR) if f.startswith('portfolio-') and f.endswith('.db'))
+    for old in backups[:-BACKUP_KEEP]:
+        os.remove(os.path.join(BACKUP_DIR, old))
+
+    report.append(('backup', time.perf_counter() - start,
+                   f'{target} ({os.path.getsize(target):,} bytes)'))
+    return target
+
+
+def maintain(report: Report):
+    """Checkpoint the WAL, compact the change log, rebuild related articles,
+    refresh planner statistics and reclaim free pages."""
+    conn = get_db_connection()
+    try:
+        start = time.perf_counter()
+        busy, log_frames, checkpointed = conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone()
+        if log_frames == -1:
+            details = 'not in WAL mode'
+        else:
+            details = f'{checkpointed}/{log_frames} frames' + (' (busy)' if busy else '')
+        report.append(('wal_checkpoint', time.perf_counter() - start, details))
+
+        start = time.perf_counter()
+        removed = compact_article_changes()
+        report.append(('compact_changes', time.perf_counter() - start, f'removed {removed:,} superseded rows'))
+
+        start = time.perf_counter()
+        rebuild_related_index()
+        report.append(('rebuild_related', time.perf_counter() - start, ''))
+
+        start = time.perf_counter()
+        conn.execute('PRAGMA optimize')
+        report.append(('optimize', time.perf_counter() - start, ''))
+
+        start = time.perf_counter()
+        size_before, free_before = _database_bytes(conn)
+        auto_vacuum = conn.execute('PRAGMA auto_vacuum').fetchone()[0]
+        if auto_vacuum == 2:
+            # executescript steps the pragma to completion; execute() stops
+            # after the first freed page
+            conn.executescript('PRAGMA incremental_vacuum;')
+            size_after, _ = _database_bytes(conn)
+            details = f'reclaimed {size_before - size_after:,} bytes'
+        else:
+            details = (f'skipped, {free_before:,} free bytes; '
+                       'run "python maintenance.py enable-incremental-vacuum" once')
+        report.append(('incremental_vacuum', time.perf_counter() - start, details))
+    finally:
+        conn.close()
+
+
+def enable_incremental_vacuum(report: Report):
+    """Switch the database to incremental auto-vacuum. Rewrites the whole file."""
+    conn = get_db_connection()
+    try:
+        start = time.perf_counter()
+        size_before, _ = _database_bytes(conn)
+        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        conn.execute('VACUUM')
+        size_after, _ = _database_bytes(conn)
+        report.append(('vacuum', time.perf_counter() - start,
+                       f'reclaimed {size_before - size_after:,} bytes, auto_vacuum=INCREMENTAL'))
+    finally:
+        conn.close()
+
+
+def run_all(min_interval: float = 0) -> Report:
+    """Run backup and maintenance unless another process is running them, or
+    completed them less than `min_interval` seconds ago."""
+    report: Report = []
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(LOCK_PATH, 'w') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            report.append(('skipped', 0.0, 'maintenance already running in another process'))
+            return report
+        if os.path.exists(LAST_RUN_PATH) and time.time() - os.path.getmtime(LAST_RUN_PATH) < min_interval:
+            report.append(('skipped', 0.0, 'maintenance ran less than min_interval ago'))
+            return report
+        backup(report)
+        maintain(report)
+        with open(LAST_RUN_PATH, 'w') as f:
+            f.write(time.strftime('%Y-%m-%d %H:%M:%S\n'))
+    return report
+
+
+def print_report(report: Report):
+    for step, seconds, details in report:
+        print(f"Maintenance {step}: {seconds * 1000:.1f}ms {details}".rstrip())
+
+
+def _scheduler_loop(interval_seconds: float):
+    # Workers are recycled long before a typical interval elapses, so the
+    # schedule lives in LAST_RUN_PATH rather than in this thread's timer
+    while True:
+        time.sleep(min(SCHEDULER_TICK_SECONDS, interval_seconds))
+        try:
+            report = run_all(min_interval=interval_seconds)
+            if report[0][0] != 'skipped':
+                print_report(report)
+        except Exception as e:
+            print(f"Error running scheduled maintenance: {str(e)}")
+
+
+def start_scheduler():
+    """Start the background maintenance thread if MAINTENANCE_INTERVAL_HOURS is set.
+
+    Call it after forking (gunicorn's post_fork hook), never in a process
+    that forks workers. Every worker starts one and checks every
+    SCHEDULER_TICK_SECONDS; run_all() makes sure only one of them does the
+    work, once the last run is an interval old.
+    """
+    if MAINTENANCE_INTERVAL_HOURS <= 0:
+        return None
+    thread = threading.Thread(target=_scheduler_loop, args=(MAINTENANCE_INTERVAL_HOURS * 3600,),
+                              name='maintenance', daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Back up and maintain the portfolio database.')
+    parser.add_argument('task', nargs='?', default='all',
+                        choices=['all', 'backup', 'maintain', 'enable-incremental-vacuum'])
+    args = parser.parse_args()
+
+    report: Report = []
+    if args.task == 'all':
+        report = run_all()
+    elif args.task == 'backup':
+        backup(report)
+    elif args.task == 'maintain':
+        maintain(report)
+    else:
+        enable_incremental_vacuum(report)
+    print_report(report)
@@ -0,0 +1,173 @@
+"""
+Static publish pipeline for the public portfolio pages.
+
+Pre-renders the home page (both languages), every paginated page of
+/api/articles, the full article list and each article as JSON into a
+versioned release directory, writes precompressed .gz siblings and then
+atomically switches the `current` symlink to the new release.
+
+Every file is written under the same path the app serves it at, and the
+pages only link to and fetch those paths, so a plain static file server
+with PUBLISH_DIR/current as its document root can answer the public
+pages without rewrites. Everything else must still reach the app: the
+admin panel and its /api/articles calls, the query-string endpoints
+(/api/articles?..., /fragments/articles?..., /api/changes), /login and
+every write. Releases contain api/articles/ and fragments/articles/
+directories, so the server must not answer directory URLs itself
+(see the nginx example in README.md).
+
+Layout of a release:
+    index.html, en/index.html           GET /, /en/
+    sitemap.xml, feed.xml, en/feed.xml  GET /sitemap.xml, /feed.xml, /en/feed.xml
+                                        (only when SITE_URL is set)
+    api/articles.json                   GET /api/articles.json
+    api/articles/page/<limit>/<offset>.json
+    api/articles/<id>.json
+    fragments/articles/page/<limit>/<offset>/<lang>.html
+
+Run manually with:  python publish.py
+"""
+import fcntl
+import gzip
+import os
+import shutil
+import time
+
+from database import get_all_articles
+
+PUBLISH_DIR = os.getenv('PUBLISH_DIR', os.path.join(os.getenv('DATA_DIR', 'data'), 'public'))
+STATIC_PUBLISH = os.getenv('STATIC_PUBLISH', 'False') == 'True'
+PAGE_SIZE = 6
+KEEP_RELEASES = 3
+LANGUAGES = ('es', 'en')
+# Serializes publishes across threads and gunicorn workers
+LOCK_PATH = os.path.join(PUBLISH_DIR, 'publish.lock')
+
+
+def _write(release_dir: str, rel_path: str, body: bytes):
+    """Write a file and its precompressed .gz sibling."""
+    path = os.path.join(release_dir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(body)
+    with open(path + '.gz', 'wb') as f:
+        # mtime=0 keeps the output byte-identical for unchanged content
+        f.write(gzip.compress(body, compresslevel=9, mtime=0))
+
+
+def _render(client, url: str) -> bytes:
+    response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f'Rendering {url} failed with status {response.status_code}')
+    return response.get_data()
+
+
+def _current_release():
+    """Name of the release `current` points at, or None."""
+    try:
+        return os.path.basename(os.readlink(os.path.join(PUBLISH_DIR, 'current')))
+    except OSError:
+        return None
+
+
+def _switch_current(release_dir: str):
+    """Atomically point PUBLISH_DIR/current at release_dir."""
+    current = os.path.join(PUBLISH_DIR, 'current')
+    tmp_link = current + '.tmp'
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(os.path.relpath(release_dir, PUBLISH_DIR), tmp_link)
+    os.replace(tmp_link, current)
+
+
+def _prune_releases(keep: int = KEEP_RELEASES):
+    """Remove old releases, keeping the newest `keep` ones and the active one."""
+    releases_dir = os.path.join(PUBLISH_DIR, 'releases')
+    releases = sorted(os.listdir(releases_dir))
+    active = _current_release()
+    for name in releases[:-keep]:
+        if name == active:
+            continue
+        shutil.rmtree(os.path.join(releases_dir, name), ignore_errors=True)
+
+
+def publish_site(flask_app) -> str:
+    """Render all public content into a new release and activate it.
+
+    Returns the path of the new release directory.
+    """
+    os.makedirs(PUBLISH_DIR, exist_ok=True)
+    with open(LOCK_PATH, 'w') as lock_file:
+        # flock locks are per open file, so this also serializes threads
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return _publish(flask_app)
+
+
+def _release_name() -> str:
+    """Release name that sorts in publish order (UTC time plus nanoseconds)."""
+    now_ns = time.time_ns()
+    return time.strftime('%Y%m%d%H%M%S', time.gmtime(now_ns // 1_000_000_000)) + f'-{now_ns % 1_000_000_000:09d}'
+
+
+def _publish(flask_app) -> str:
+    version = _release_name()
+    release_dir = os.path.join(PUBLISH_DIR, 'releases', version)
+    os.makedirs(release_dir)
+
+    client = flask_app.test_client()
+
+    def publish(path: str, url: str = None):
+        _write(release_dir, path, _render(client, url or '/' + path))
+
+    for lang in LANGUAGES:
+        prefix = '' if lang == 'es' else f'{lang}/'
+        publish(f'{prefix}index.html', f'/{prefix}')
+
+    # Without SITE_URL the test client would put http://localhost/ links
+    # into these; leave them to the app, which uses the request host.
+    if flask_app.config.get('SITE_URL'):
+        publish('sitemap.xml')
+        for lang in LANGUAGES:
+            publish('feed.xml' if lang == 'es' else f'{lang}/feed.xml')
+    else:
+        print("SITE_URL is not set; skipping sitemap.xml and feeds in the static publish")
+    publish('api/articles.json')
+
+    articles = get_all_articles()
+    # Always publish the first page, even for an empty catalog
+    for offset in range(0, max(len(articles), 1), PAGE_SIZE):
+        publish(f'api/articles/page/{PAGE_SIZE}/{offset}.json')
+        for lang in LANGUAGES:
+            publish(f'fragments/articles/page/{PAGE_SIZE}/{offset}/{lang}.html')
+
+    for article in articles:
+        publish(f'api/articles/{article.id}.json')
+
+    _switch_current(release_dir)
+    _prune_releases()
+
+    return release_dir
+
+
+def publish_if_enabled(flask_app):
+    """Publish after a content change when STATIC_PUBLISH is enabled.
+
+    Errors are logged and swallowed: the database write already succeeded
+    and the dynamic routes keep serving correct content.
+    """
+    if not STATIC_PUBLISH:
+        return
+    try:
+        publish_site(flask_app)
+    except Exception as e:
+        print(f"Error publishing static site: {str(e)}")
+
+
+if __name__ == '__main__':
+    from app import app
+
+    start = time.perf_counter()
+    release = publish_site(app)
+    elapsed = time.perf_counter() - start
+    print(f"Published {release} in {elapsed:.2f}s")
+    print(f"Active release: {os.path.join(PUBLISH_DIR, 'current')}")
@@ -134,7 +134,7 @@ wait_for_health() {
     local attempt=1
 
     while [ $attempt -le $max_attempts ]; do
-        if docker exec $CONTAINER_NAME python -c "import urllib.request; urllib.request.urlopen('http://localhost:8080/api/articles')" 2>/dev/null; then
+        if docker exec $CONTAINER_NAME python -c "import urllib.request; urllib.request.urlopen('http://localhost:8080/readyz')" 2>/dev/null; then
             echo -e "${GREEN}✓ Application is healthy!${NC}"
             return 0
         fi
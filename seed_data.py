@@ -1,8 +1,23 @@
 """
-Seed script to populate the database with initial portfolio articles.
-Run this script once to add sample data to your database.
+Seed script to populate the database.
+
+Without options it adds the hand-written portfolio articles. With --articles
+and/or --messages it generates a deterministic synthetic dataset of any size
+(bilingual articles, tech stacks and contact messages) using bulk inserts,
+for reproducing scaling issues:
+
+    python seed_data.py                                  # real portfolio articles
+    python seed_data.py --articles 1000000 --messages 200000 --seed 42
+    python seed_data.py --articles 1000000 --skip-related   # load only
 """
-from database import init_db, create_article
+import argparse
+import itertools
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from database import init_db, create_article, get_db_connection, rebuild_related_index
 
 def seed_portfolio():
     """Add initial portfolio articles to the database."""
@@ -58,5 +73,184 @@ def seed_portfolio():
     print("\nDatabase seeded successfully!")
     print("You can now run 'python app.py' to start the application.")
 
+# Synthetic dataset generation
+
+BATCH_SIZE = 50_000
+
+# Fixed epoch so the same seed always produces the same timestamps
+BASE_DATE = datetime(2018, 1, 1)
+DATE_RANGE_SECONDS = 8 * 365 * 24 * 3600
+
+TECHNOLOGIES = [
+    'Python', 'Flask', 'Django', 'FastAPI', 'SQLite', 'PostgreSQL', 'MySQL', 'Redis',
+    'Docker', 'Kubernetes', 'React', 'Vue', 'TypeScript', 'Node.js', 'Laravel', 'PHP',
+    'Snowflake', 'Airflow', 'dbt', 'Spark', 'Metabase', 'AWS', 'GCP', 'Terraform',
+    'OpenAI', 'LangChain', 'Pandas', 'ETL', 'BI', 'Go', 'Rust', 'GraphQL'
+]
+
+# (Spanish, English) word pairs so both languages describe the same project
+PROJECT_KINDS = [
+    ('Sistema de', 'System for'), ('Plataforma de', 'Platform for'),
+    ('Pipeline de', 'Pipeline for'), ('Dashboard de', 'Dashboard for'),
+    ('API de', 'API for'), ('Automatización de', 'Automation of'),
+    ('Migración de', 'Migration of'), ('Asistente de IA para', 'AI assistant for')
+]
+
+PROJECT_SUBJECTS = [
+    ('gestión de inventario', 'inventory management'), ('control de tiempos', 'time tracking'),
+    ('análisis de ventas', 'sales analytics'), ('reportes financieros', 'financial reporting'),
+    ('atención al cliente', 'customer support'), ('procesamiento de datos', 'data processing'),
+    ('facturación electrónica', 'electronic invoicing'), ('recursos humanos', 'human resources'),
+    ('logística', 'logistics'), ('monitoreo de servidores', 'server monitoring'),
+    ('comercio electrónico', 'e-commerce'), ('gestión documental', 'document management')
+]
+
+DESCRIPTION_PHRASES = [
+    ('Incluye reportes automáticos y dashboard analítico.', 'Includes automatic reports and an analytical dashboard.'),
+    ('Procesamiento de datos masivos con orquestación automatizada.', 'Massive data processing with automated orchestration.'),
+    ('Integración con servicios externos mediante APIs REST.', 'Integration with external services through REST APIs.'),
+    ('Despliegue en contenedores con integración continua.', 'Containerized deployment with continuous integration.'),
+    ('Interfaz responsiva optimizada para dispositivos móviles.', 'Responsive interface optimized for mobile devices.'),
+    ('Modelos de lenguaje para generación de contenido.', 'Language models for content generation.'),
+    ('Autenticación segura y control de acceso por roles.', 'Secure authentication and role-based access control.'),
+    ('Reducción significativa de tiempos de procesamiento.', 'Significant reduction in processing times.')
+]
+
+GRADIENTS = [
+    'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
+    'linear-gradient(135deg, #f093fb 0%, #f5576c 100%)',
+    'linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)',
+    'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)',
+    'linear-gradient(135deg, #fa709a 0%, #fee140 100%)'
+]
+
+FIRST_NAMES = ['Ana', 'Carlos', 'María', 'John', 'Sofía', 'Diego', 'Laura', 'Peter', 'Camila', 'Jorge']
+LAST_NAMES = ['González', 'Smith', 'Muñoz', 'Rojas', 'Díaz', 'Brown', 'Soto', 'Silva', 'Pérez', 'Lee']
+MESSAGE_PHRASES = [
+    'Me gustaría conversar sobre un proyecto de automatización.',
+    'I would like to discuss a data pipeline project.',
+    '¿Tienes disponibilidad para una consultoría el próximo mes?',
+    'We are looking for help integrating AI into our product.',
+    'Vi tu portafolio y me interesa tu experiencia en BI.',
+    'Could you share your rates for a short engagement?'
+]
+
+def _timestamp(rng: random.Random) -> str:
+    return (BASE_DATE + timedelta(seconds=rng.randrange(DATE_RANGE_SECONDS))).strftime('%Y-%m-%d %H:%M:%S')
+
+def _generate_articles(rng: random.Random, first_id: int, count: int):
+    """Yield (article_row, translation_row) tuples."""
+    for article_id in range(first_id, first_id + count):
+        kind_es, kind_en = rng.choice(PROJECT_KINDS)
+        subject_es, subject_en = rng.choice(PROJECT_SUBJECTS)
+        phrases = rng.sample(DESCRIPTION_PHRASES, rng.randint(2, 4))
+        created_at = _timestamp(rng)
+        updated_at = created_at if rng.random() < 0.7 else _timestamp(rng)
+        title = f'{kind_es} {subject_es}'
+        yield (
+            (article_id, title, ' '.join(p[0] for p in phrases), None,
+             rng.choice(GRADIENTS), title[0].upper(),
+             json.dumps(rng.sample(TECHNOLOGIES, rng.randint(2, 6))),
+             created_at, max(created_at, updated_at)),
+            (article_id, 'en', f'{kind_en} {subject_en}', ' '.join(p[1] for p in phrases))
+        )
+
+def _generate_messages(rng: random.Random, count: int):
+    for _ in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f'{first.lower()}.{last.lower()}{rng.randrange(1000)}@example.com'
+        yield (f'{first} {last}', email, ' '.join(rng.sample(MESSAGE_PHRASES, 2)),
+               int(rng.random() < 0.5), _timestamp(rng))
+
+def _batches(iterable, size: int):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _tune_for_loading(conn):
+    # Durability is not needed for a throwaway test dataset; a crash mid-load
+    # just means regenerating it.
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('PRAGMA journal_mode = MEMORY')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA cache_size = -262144')  # 256 MB
+
+def generate_dataset(articles: int = 0, messages: int = 0, seed: int = 42,
+                     related: bool = True):
+    """Bulk-insert a deterministic synthetic dataset and report throughput.
+
+    With `related` False the related-articles index is left stale; it is
+    rebuilt by the next maintenance run.
+    """
+    rng = random.Random(seed)
+    conn = get_db_connection()
+    _tune_for_loading(conn)
+
+    if articles:
+        first_id = conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM portfolio_articles').fetchone()[0]
+        start = time.perf_counter()
+        for batch in _batches(_generate_articles(rng, first_id, articles), BATCH_SIZE):
+            with conn:
+                conn.executemany('''
+                    INSERT INTO portfolio_articles
+                        (id, title, description, image_url, image_gradient, image_letter,
+                         tech_stack, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [row[0] for row in batch])
+                conn.executemany('''
+                    INSERT INTO article_translations (article_id, lang, title, description)
+                    VALUES (?, ?, ?, ?)
+                ''', [row[1] for row in batch])
+        elapsed = time.perf_counter() - start
+        print(f"✓ Inserted {articles:,} articles (+{articles:,} translations) "
+              f"in {elapsed:.2f}s ({articles / elapsed:,.0f} articles/s)")
+
+    if messages:
+        start = time.perf_counter()
+        for batch in _batches(_generate_messages(rng, messages), BATCH_SIZE):
+            with conn:
+                conn.executemany('''
+                    INSERT INTO contact_messages (name, email, message, read_status, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', batch)
+        elapsed = time.perf_counter() - start
+        print(f"✓ Inserted {messages:,} contact messages in {elapsed:.2f}s "
+              f"({messages / elapsed:,.0f} messages/s)")
+
+    if articles and not related:
+        print("✓ Skipped related articles index; run 'python maintenance.py maintain' to build it")
+    elif articles:
+        # Bulk inserts bypass the incremental related-articles maintenance;
+        # the rebuild also fills the article_tech index
+        start = time.perf_counter()
+        rebuild_related_index()
+        print(f"✓ Rebuilt related articles index in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    conn.execute('ANALYZE')
+    conn.close()
+    print(f"✓ Updated query planner statistics in {time.perf_counter() - start:.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed the portfolio database.')
+    parser.add_argument('--articles', type=int, default=0,
+                        help='number of synthetic articles to generate')
+    parser.add_argument('--messages', type=int, default=0,
+                        help='number of synthetic contact messages to generate')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='random seed; the same seed produces the same data')
+    parser.add_argument('--skip-related', action='store_true',
+                        help='do not rebuild the related articles index after loading '
+                             '(it takes far longer than the load itself)')
+    args = parser.parse_args()
+
+    if args.articles or args.messages:
+        generate_dataset(args.articles, args.messages, args.seed, related=not args.skip_related)
+    else:
+        seed_portfolio()
+
 if __name__ == '__main__':
-    seed_portfolio()
+    main()
@@ -0,0 +1,62 @@
+"""
+Fast JSON serialization for API responses.
+
+Uses orjson when it is installed and falls back to Flask's standard
+library provider otherwise. Article records are serialized directly, so
+route handlers can pass them to jsonify() without building dicts first.
+"""
+import typing as t
+
+from flask.json.provider import DefaultJSONProvider
+
+from database import Article
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# orjson.Fragment (orjson >= 3.9) embeds already-encoded JSON verbatim, so the
+# stored tech_stack text goes into the response without being decoded first.
+_Fragment = getattr(orjson, 'Fragment', None)
+
+
+def _article_dict(article: Article) -> dict:
+    if _Fragment is None:
+        return article.to_dict()
+    return article.to_dict(tech_stack=_Fragment(article.tech_stack_json))
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that understands Article records and prefers orjson."""
+
+    # Key sorting costs time on every response and clients don't rely on it
+    sort_keys = False
+
+    @staticmethod
+    def default(o: t.Any) -> t.Any:
+        if isinstance(o, Article):
+            return _article_dict(o)
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj, indent=kwargs.get('indent')).decode('utf-8')
+
+    def _orjson_dumps(self, obj: t.Any, indent=None) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def response(self, *args: t.Any, **kwargs: t.Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        # Hand orjson's bytes straight to the response without a str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._orjson_dumps(obj, indent=indent) + b'\n', mimetype=self.mimetype
+        )
@@ -45,7 +45,7 @@ def test_database():
         if articles:
             print("\n   Articles in database:")
             for article in articles:
-                print(f"   - {article['title']} (ID: {article['id']})")
+                print(f"   - {article.title} (ID: {article.id})")
         else:
             print("   ℹ️  No articles found (database is empty)")
             print("   💡 Run 'python seed_data.py' to add sample articles")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Check that a database created with the original schema migrates cleanly.
+
+Builds a throwaway database with title_en/description_en columns holding
+real translations, copies of the Spanish text, NULLs and empty strings,
+opens it through database.ensure_db() and verifies what reads return.
+
+Run with:  python test_migrations.py   (or pytest)
+"""
+import os
+import sqlite3
+import tempfile
+
+import database
+
+BASELINE_SCHEMA = '''
+    CREATE TABLE portfolio_articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        title_en TEXT,
+        description_en TEXT,
+        image_url TEXT,
+        image_gradient TEXT DEFAULT 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
+        image_letter TEXT DEFAULT '',
+        tech_stack TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE contact_messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        message TEXT NOT NULL,
+        read_status BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+'''
+
+# (id, title, description, title_en, description_en, expected English title, description)
+BASELINE_ROWS = [
+    (1, 'Hola', 'Desc', 'Hello', 'Description', 'Hello', 'Description'),
+    (2, 'Copia', 'Igual', 'Copia', 'Igual', 'Copia', 'Igual'),
+    (3, 'Nulo', 'Sin texto', None, None, 'Nulo', 'Sin texto'),
+    (4, 'Vacio', 'En blanco', '', '', 'Vacio', 'En blanco'),
+    (5, 'Mixto', 'Parcial', 'Mixed', '', 'Mixed', 'Parcial'),
+]
+
+
+def _create_baseline_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany('''
+        INSERT INTO portfolio_articles (id, title, description, title_en, description_en, tech_stack)
+        VALUES (?, ?, ?, ?, ?, '["Python"]')
+    ''', [row[:5] for row in BASELINE_ROWS])
+    conn.commit()
+    conn.close()
+
+
+def test_baseline_schema_migrates():
+    saved = (database.DATA_DIR, database.DATABASE, database._db_ready)
+    with tempfile.TemporaryDirectory() as data_dir:
+        database.DATA_DIR = data_dir
+        database.DATABASE = os.path.join(data_dir, 'portfolio.db')
+        database._db_ready = False
+        try:
+            _create_baseline_db(database.DATABASE)
+            database.ensure_db()
+
+            conn = database.get_db_connection()
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            columns = [column[1] for column in conn.execute('PRAGMA table_info(portfolio_articles)')]
+            translations = conn.execute(
+                'SELECT article_id, title, description FROM article_translations ORDER BY article_id'
+            ).fetchall()
+            conn.close()
+            assert version == len(database.MIGRATIONS)
+            assert 'title_en' not in columns and 'description_en' not in columns
+            # Copies, NULLs and empty strings are not carried over
+            assert [tuple(row) for row in translations] == [(1, 'Hello', 'Description'), (5, 'Mixed', None)]
+
+            for article_id, title, description, _, _, title_en, description_en in BASELINE_ROWS:
+                both = database.get_article_by_id(article_id)
+                assert (both.title, both.description) == (title, description)
+                assert (both.title_en, both.description_en) == (title_en, description_en)
+                english = database.get_article_by_id(article_id, lang='en')
+                assert (english.title, english.description) == (title_en, description_en)
+
+            # Empty translations written after the migration fall back too
+            article_id = database.create_article('Hola', 'Desc', ['Go'], title_en='', description_en='')
+            english = database.get_article_by_id(article_id, lang='en')
+            assert (english.title, english.description) == ('Hola', 'Desc')
+            assert database.get_article_by_id(article_id).title_en == 'Hola'
+        finally:
+            database.DATA_DIR, database.DATABASE, database._db_ready = saved
+
+
+if __name__ == '__main__':
+    test_baseline_schema_migrates()
+    print("✅ Original schema migrates and falls back to Spanish for missing translations")
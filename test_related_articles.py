@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Randomized check of the incremental related-articles index.
+
+Applies random creates, updates and deletes to a throwaway database and
+verifies after every write that related_articles matches a full rebuild.
+The per-write caps and the candidate window are lifted, so the
+incremental result must be exact.
+
+Run with:  python test_related_articles.py   (or pytest)
+"""
+import os
+import random
+import tempfile
+
+import database
+
+TECHNOLOGIES = ['Python', 'Flask', 'SQLite', 'Docker', 'React', 'Redis', 'Go', 'AWS']
+
+
+def _related_rows(cursor):
+    return cursor.execute(
+        'SELECT article_id, related_id, score FROM related_articles ORDER BY article_id, related_id'
+    ).fetchall()
+
+
+def _rebuilt_rows():
+    """Related rows a full rebuild would produce, without keeping it."""
+    conn = database.get_db_connection()
+    cursor = conn.cursor()
+    database._rebuild_related_index(cursor)
+    rows = _related_rows(cursor)
+    conn.rollback()
+    conn.close()
+    return rows
+
+
+def _current_rows():
+    conn = database.get_db_connection()
+    rows = _related_rows(conn.cursor())
+    conn.close()
+    return rows
+
+
+def test_related_index_matches_rebuild(steps: int = 300, seed: int = 7):
+    saved = (database.DATA_DIR, database.DATABASE, database._db_ready,
+             database.RELATED_MAX_UPDATES, database.RELATED_CANDIDATES_PER_TECH)
+    with tempfile.TemporaryDirectory() as data_dir:
+        database.DATA_DIR = data_dir
+        database.DATABASE = os.path.join(data_dir, 'portfolio.db')
+        database._db_ready = False
+        database.RELATED_MAX_UPDATES = 10_000
+        database.RELATED_CANDIDATES_PER_TECH = 10_000
+        try:
+            rng = random.Random(seed)
+            ids = []
+            for step in range(steps):
+                action = rng.random()
+                stack = rng.sample(TECHNOLOGIES, rng.randint(1, 4))
+                if action < 0.5 or len(ids) < 5:
+                    ids.append(database.create_article(f'Article {step}', 'Description', stack))
+                elif action < 0.8:
+                    article_id = rng.choice(ids)
+                    database.update_article(article_id, f'Article {step}', 'Description', stack)
+                else:
+                    article_id = ids.pop(rng.randrange(len(ids)))
+                    database.delete_article(article_id)
+
+                assert _current_rows() == _rebuilt_rows(), f'index diverged at step {step} ({len(ids)} articles)'
+        finally:
+            (database.DATA_DIR, database.DATABASE, database._db_ready,
+             database.RELATED_MAX_UPDATES, database.RELATED_CANDIDATES_PER_TECH) = saved
+
+
+if __name__ == '__main__':
+    test_related_index_matches_rebuild()
+    print("✅ Incremental related-articles index matches a full rebuild")
@@ -29,22 +29,22 @@ def update_portfolio_translations():
     }
 
     for article in articles:
-        if article['title'] in translations:
-            trans = translations[article['title']]
+        if article.title in translations:
+            trans = translations[article.title]
             success = update_article(
-                article_id=article['id'],
-                title=article['title'],
-                description=article['description'],
-                tech_stack=article['tech_stack'],
+                article_id=article.id,
+                title=article.title,
+                description=article.description,
+                tech_stack=article.tech_stack,
                 title_en=trans['title_en'],
                 description_en=trans['description_en']
             )
             if success:
-                print(f"✓ Updated article: {article['title']}")
+                print(f"✓ Updated article: {article.title}")
             else:
-                print(f"✗ Failed to update article: {article['title']}")
+                print(f"✗ Failed to update article: {article.title}")
         else:
-            print(f"⚠ No translation found for: {article['title']}")
+            print(f"⚠ No translation found for: {article.title}")
 
     print("\nTranslations updated successfully!")
 